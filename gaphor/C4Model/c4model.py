@@ -18,12 +18,14 @@ from gaphor.core.modeling.properties import (
 
 from gaphor.UML.uml import Actor
 class Person(Actor):
+    __slots__ = ()
     description: _attribute[str] = _attribute("description", str)
     location: _attribute[str] = _attribute("location", str)
 
 
 from gaphor.UML.uml import Package
 class Container(Package):
+    __slots__ = ()
     description: _attribute[str] = _attribute("description", str)
     location: _attribute[str] = _attribute("location", str)
     ownerContainer: relation_one[Container]
@@ -33,16 +35,18 @@ class Container(Package):
 
 
 class Database(Container):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Dependency as _Dependency
 class Dependency(_Dependency):
+    __slots__ = ()
     technology: _attribute[str] = _attribute("technology", str)
 
 
 from gaphor.UML.uml import Diagram
 class C4Diagram(Diagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="c4")
 
 
@@ -19,37 +19,41 @@ from gaphor.core.modeling.properties import (
 from gaphor.UML.uml import Class
 from gaphor.SysML.sysml import Block
 class Situation(Block, Class):
-    pass
+    __slots__ = ()
 
 
 from gaphor.SysML.sysml import DirectedRelationshipPropertyPath
 from gaphor.UML.uml import Dependency as _Dependency
 class RelevantTo(DirectedRelationshipPropertyPath, _Dependency):
-    pass
+    __slots__ = ()
 
 
 class ControllingMeasure(DirectedRelationshipPropertyPath, _Dependency):
+    __slots__ = ()
     affects: relation_many[Property]
 
 
 class Violates(_Dependency):
-    pass
+    __slots__ = ()
 
 
 class AnySituation(Situation):
+    __slots__ = ()
     from_: relation_many[AnySituation]
     to: relation_many[AnySituation]
 
 
 class AbstractEvent(AnySituation):
-    pass
+    __slots__ = ()
 
 
 class AbstractCause(AbstractEvent):
+    __slots__ = ()
     error: relation_many[DysfunctionalEvent]
 
 
 class DysfunctionalEvent(AbstractEvent):
+    __slots__ = ()
     error: relation_many[DysfunctionalEvent]
     failure: relation_many[DysfunctionalEvent]
     fault: relation_many[AbstractCause]
@@ -58,30 +62,32 @@ class DysfunctionalEvent(AbstractEvent):
 
 
 class AbstractFailureMode(DysfunctionalEvent):
-    pass
+    __slots__ = ()
 
 
 class AbstractEffect(DysfunctionalEvent):
-    pass
+    __slots__ = ()
 
 
 class Effect(AbstractEffect):
-    pass
+    __slots__ = ()
 
 
 class HarmPotential(AnySituation):
-    pass
+    __slots__ = ()
 
 
 class Hazard(HarmPotential):
-    pass
+    __slots__ = ()
 
 
 class Scenario(AnySituation):
+    __slots__ = ()
     scenarioStep: relation_many[AnySituation]
 
 
 class AbstractRisk(Scenario):
+    __slots__ = ()
     harm: relation_many[AbstractEffect]
     harmPotential: relation_many[HarmPotential]
     trigger: relation_many[AbstractEvent]
@@ -89,363 +95,371 @@ class AbstractRisk(Scenario):
 
 from gaphor.UML.uml import Dependency
 class Detection(ControllingMeasure, Dependency):
-    pass
+    __slots__ = ()
 
 
 class Prevention(ControllingMeasure, Dependency):
-    pass
+    __slots__ = ()
 
 
 class Mitigation(ControllingMeasure, Dependency):
-    pass
+    __slots__ = ()
 
 
 class Recommendation(ControllingMeasure, Dependency):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import State
 class FailureState(State):
-    pass
+    __slots__ = ()
 
 
 class FTAElement(DysfunctionalEvent):
-    pass
+    __slots__ = ()
 
 
 class FTATree(FTAElement, Scenario):
+    __slots__ = ()
     topEvent: relation_one[EventDef]
 
 
 class Tree(Class):
-    pass
+    __slots__ = ()
 
 
 class EventDef(FTAElement):
-    pass
+    __slots__ = ()
 
 
 class Event(Class):
-    pass
+    __slots__ = ()
 
 
 class Gate(Class):
-    pass
+    __slots__ = ()
 
 
 class DormantEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class BasicEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class ConditionalEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class ZeroEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class HouseEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class AND(Class):
-    pass
+    __slots__ = ()
 
 
 class OR(Class):
-    pass
+    __slots__ = ()
 
 
 class SEQ(Class):
-    pass
+    __slots__ = ()
 
 
 class XOR(Class):
-    pass
+    __slots__ = ()
 
 
 class INHIBIT(Class):
-    pass
+    __slots__ = ()
 
 
 class MAJORITY_VOTE(Class):
-    pass
+    __slots__ = ()
 
 
 class NOT(Class):
-    pass
+    __slots__ = ()
 
 
 class IntermediateEvent(Class):
-    pass
+    __slots__ = ()
 
 
 class TopEvent(Class):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Property as _Property
 class TransferIn(_Property):
-    pass
+    __slots__ = ()
 
 
 class TransferOut(Class):
-    pass
+    __slots__ = ()
 
 
 class BasicEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class IntermediateEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class TopEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class ConditionalEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class DormantEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class UndevelopedEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class HouseEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class ZeroEventDef(EventDef):
-    pass
+    __slots__ = ()
 
 
 class Undeveloped(Class):
-    pass
+    __slots__ = ()
 
 
 class GateDef():
-    pass
+    __slots__ = ()
 
 
 class UndesiredState(DysfunctionalEvent):
-    pass
+    __slots__ = ()
 
 
 class Cause(AbstractCause):
-    pass
+    __slots__ = ()
 
 
 class MAJORITY_VOTE_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class NOT_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class OR_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class SEQ_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class XOR_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class AND_Def(GateDef):
-    pass
+    __slots__ = ()
 
 
 class INHIBIT_Def(GateDef):
+    __slots__ = ()
     condition: relation_many[EventDef]
 
 
 class UnsafeControlAction_Def(Situation):
+    __slots__ = ()
     Context: relation_one[AbstractOperationalSituation]
     harmPotential: relation_many[HarmPotential]
 
 
 from gaphor.UML.uml import Property
 class Actuator(Property):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import DataType
 class Signal():
-    pass
+    __slots__ = ()
 
 
 class ControlAction(Class, DataType, Signal):
-    pass
+    __slots__ = ()
 
 
 class ControlStructure(Block, Class):
-    pass
+    __slots__ = ()
 
 
 class ControlledProcess(Property):
-    pass
+    __slots__ = ()
 
 
 class Controller(Property):
-    pass
+    __slots__ = ()
 
 
 class Feedback(Class, DataType, Signal):
-    pass
+    __slots__ = ()
 
 
 class Sensor(Property):
-    pass
+    __slots__ = ()
 
 
 class Early_UCA(UnsafeControlAction_Def):
-    pass
+    __slots__ = ()
 
 
 class FailureMode():
-    pass
+    __slots__ = ()
 
 
 class UnsafeControlAction(Class, FailureMode):
-    pass
+    __slots__ = ()
 
 
 class OperationalSituation(Class):
-    pass
+    __slots__ = ()
 
 
 class OperationalCondition(Situation):
-    pass
+    __slots__ = ()
 
 
 class AbstractOperationalSituation(OperationalCondition):
+    __slots__ = ()
     conditions: relation_many[OperationalCondition]
 
 
 class Factor(AbstractCause):
-    pass
+    __slots__ = ()
 
 
 class ProcessModel():
-    pass
+    __slots__ = ()
 
 
 class InadequateControlExecution(ProcessModel):
-    pass
+    __slots__ = ()
 
 
 class InadequateControllerDecisions(ProcessModel):
-    pass
+    __slots__ = ()
 
 
 class InadequateFeedbackAndInputs(ProcessModel):
-    pass
+    __slots__ = ()
 
 
 class InadequateProcessBehavior(ProcessModel):
-    pass
+    __slots__ = ()
 
 
 class Late_UCA(UnsafeControlAction_Def):
-    pass
+    __slots__ = ()
 
 
 class Loss(AbstractEffect):
-    pass
+    __slots__ = ()
 
 
 class LossScenario(Scenario):
+    __slots__ = ()
     Factor: relation_many[Factor]
     processModel: relation_many[ProcessModel]
     unsafeControlAction: relation_many[UnsafeControlAction_Def]
 
 
 class NotProvided(UnsafeControlAction_Def):
-    pass
+    __slots__ = ()
 
 
 class OutOfSequence(UnsafeControlAction_Def):
-    pass
+    __slots__ = ()
 
 
 class Provided(UnsafeControlAction_Def):
-    pass
+    __slots__ = ()
 
 
 class RiskRealization(AbstractRisk):
-    pass
+    __slots__ = ()
 
 
 class Threat(Factor):
-    pass
+    __slots__ = ()
 
 
 class AnyMalfunction(UndesiredState):
-    pass
+    __slots__ = ()
 
 
 class Less(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class MalfunctioningBehavior(Class, FailureMode):
-    pass
+    __slots__ = ()
 
 
 class AccidentScenario(DysfunctionalEvent, Scenario):
+    __slots__ = ()
     malfunctioningBehavior: relation_one[AnyMalfunction]
     situation: relation_many[AbstractOperationalSituation]
 
 
 class More(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class No(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class Intermittent(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class Unintended(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class Early(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class Late(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 class Inverted(AnyMalfunction):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Diagram
 class FTADiagram(Diagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="fta")
 
 
 class STPADiagram(Diagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="stpa")
 
 
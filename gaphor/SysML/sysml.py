@@ -26,6 +26,7 @@ def _directed_relationship_property_path_target_source(type):
 
 from gaphor.UML.uml import NamedElement
 class AbstractRequirement(NamedElement):
+    __slots__ = ()
     derived: derived[AbstractRequirement]
     derivedFrom: derived[AbstractRequirement]
     externalId: _attribute[str] = _attribute("externalId", str)
@@ -39,11 +40,12 @@ class AbstractRequirement(NamedElement):
 
 from gaphor.UML.uml import Class as _Class
 class Requirement(AbstractRequirement, _Class):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import DirectedRelationship
 class DirectedRelationshipPropertyPath(DirectedRelationship):
+    __slots__ = ()
     sourceContext: relation_one[Classifier]
     sourcePropertyPath: relation_many[Property]
     targetContext: relation_one[Classifier]
@@ -52,49 +54,53 @@ class DirectedRelationshipPropertyPath(DirectedRelationship):
 
 from gaphor.UML.uml import Dependency
 class Trace(Dependency, DirectedRelationshipPropertyPath):
-    pass
+    __slots__ = ()
 
 
 class Copy(Trace):
-    pass
+    __slots__ = ()
 
 
 class Verify(Trace):
-    pass
+    __slots__ = ()
 
 
 class DeriveReqt(Trace):
-    pass
+    __slots__ = ()
 
 
 class Satisfy(Trace):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Behavior
 class TestCase(Behavior):
-    pass
+    __slots__ = ()
 
 
 class Block(_Class):
+    __slots__ = ()
     isEncapsulated: _attribute[int] = _attribute("isEncapsulated", int, default=False)
 
 
 from gaphor.UML.uml import Property
 class ConnectorProperty(Property):
+    __slots__ = ()
     connector: relation_one[Connector]
 
 
 class ParticipantProperty(Property):
+    __slots__ = ()
     end_: relation_one[Property]
 
 
 class DistributedProperty(Property):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import DataType
 class ValueType(DataType):
+    __slots__ = ()
     quantityKind: relation_one[InstanceSpecification]
     unit: relation_one[InstanceSpecification]
 
@@ -102,96 +108,106 @@ class ValueType(DataType):
 from gaphor.UML.uml import InstanceSpecification
 from gaphor.UML.uml import Element
 class ElementPropertyPath(Element):
+    __slots__ = ()
     propertyPath: relation_many[Property]
 
 
 from gaphor.UML.uml import Connector
 class BindingConnector(Connector):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import ConnectorEnd
 class NestedConnectorEnd(ConnectorEnd, ElementPropertyPath):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Classifier
 class PropertySpecificType(Classifier):
-    pass
+    __slots__ = ()
 
 
 class EndPathMultiplicity(Property):
-    pass
+    __slots__ = ()
 
 
 class BoundReference(EndPathMultiplicity):
+    __slots__ = ()
     bindingPath: relation_many[Property]
     boundend: relation_many[ConnectorEnd]
 
 
 class AdjuntProperty(Property):
+    __slots__ = ()
     principal: relation_one[Element]
 
 
 from gaphor.UML.uml import Port
 class ProxyPort(Port):
-    pass
+    __slots__ = ()
 
 
 class FullPort(Port):
-    pass
+    __slots__ = ()
 
 
 class FlowProperty(Property):
+    __slots__ = ()
     direction = _enumeration("direction", ("in", "inout", "out"), "in")
 
 
 class InterfaceBlock(Block):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import InvocationAction
 from gaphor.UML.uml import Trigger
 from gaphor.UML.uml import AddStructuralFeatureValueAction
 class InvocationOnNestedPortAction(ElementPropertyPath, InvocationAction):
+    __slots__ = ()
     onNestedPort: relation_many[Port]
 
 
 class TriggerOnNestedPort(ElementPropertyPath, Trigger):
+    __slots__ = ()
     onNestedPort: relation_many[Port]
 
 
 class AddFlowPropertyValueOnNestedPortAction(AddStructuralFeatureValueAction, ElementPropertyPath):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import ChangeEvent
 class ChangeSructuralFeatureEvent(ChangeEvent):
+    __slots__ = ()
     structuralFeature: relation_one[StructuralFeature]
 
 
 from gaphor.UML.uml import StructuralFeature
 from gaphor.UML.uml import AcceptEventAction
 class AcceptChangeStructuralFeatureEventAction(AcceptEventAction):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Feature
 class DirectedFeature(Feature):
+    __slots__ = ()
     featureDirection = _enumeration("featureDirection", ("provided", "providedRequired", "required"), "provided")
 
 
 from gaphor.UML.uml import Generalization
 class Conform(Generalization):
-    pass
+    __slots__ = ()
 
 
 class View(_Class):
+    __slots__ = ()
     stakeholder: relation_many[Stakeholder]
     viewpoint: relation_one[Viewpoint]
 
 
 class Viewpoint(_Class):
+    __slots__ = ()
     concernList: relation_many[Comment]
     language: _attribute[str] = _attribute("language", str)
     method: relation_many[Behavior]
@@ -201,145 +217,160 @@ class Viewpoint(_Class):
 
 
 class Stakeholder(Classifier):
+    __slots__ = ()
     concernList: relation_many[Comment]
 
 
 class Expose(Dependency):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Comment
 class Rationale(Comment):
-    pass
+    __slots__ = ()
 
 
 class Problem(Comment):
-    pass
+    __slots__ = ()
 
 
 class ElementGroup(Comment):
+    __slots__ = ()
     member: relation_many[Element]
     name: _attribute[str] = _attribute("name", str)
     orderedMember: relation_many[Element]
 
 
 class ConstraintBlock(Block):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Parameter
 from gaphor.UML.uml import ActivityEdge
 from gaphor.UML.uml import ParameterSet
 class Optional(Parameter):
-    pass
+    __slots__ = ()
 
 
 class Rate(ActivityEdge, Parameter):
+    __slots__ = ()
     rate: relation_many[InstanceSpecification]
 
 
 class Probability(ActivityEdge, ParameterSet):
+    __slots__ = ()
     probability: _attribute[str] = _attribute("probability", str)
 
 
 class Continuous(Rate):
-    pass
+    __slots__ = ()
 
 
 class Discrete(Rate):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Operation
 from gaphor.UML.uml import ObjectNode
 class ControlOperator(Behavior):
-    pass
+    __slots__ = ()
 
 
 class NoBuffer(ObjectNode):
-    pass
+    __slots__ = ()
 
 
 class Overwrite(ObjectNode):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import Abstraction
 class Allocate(Abstraction, DirectedRelationshipPropertyPath):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import ActivityPartition
 class AllocateActivityPartition(ActivityPartition):
-    pass
+    __slots__ = ()
 
 
 class Refine(Dependency, DirectedRelationshipPropertyPath):
-    pass
+    __slots__ = ()
 
 
 class Tagged(Property):
+    __slots__ = ()
     nonunique: _attribute[int] = _attribute("nonunique", int)
     ordered: _attribute[int] = _attribute("ordered", int)
     subsets: _attribute[str] = _attribute("subsets", str)
 
 
 class ClassifierBehaviorProperty(Property):
-    pass
+    __slots__ = ()
 
 
 from gaphor.UML.uml import InformationFlow
 class ItemFlow(InformationFlow):
+    __slots__ = ()
     itemProperty: relation_one[Property]
 
 
 from gaphor.UML.uml import Diagram
 from gaphor.UML.uml import Class
 class SysMLDiagram(Diagram):
-    pass
+    __slots__ = ()
 
 
 class StructureDiagram(SysMLDiagram):
-    pass
+    __slots__ = ()
 
 
 class BehaviorDiagram(SysMLDiagram):
-    pass
+    __slots__ = ()
 
 
 class BlockDefinitionDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="bdd")
 
 
 class InternalBlockDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="ibd")
 
 
 class ParametricDiagram(InternalBlockDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="par")
 
 
 class PackageDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="pkg")
 
 
 class RequirementDiagram(SysMLDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="req")
 
 
 class ActivityDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="act")
 
 
 class SequenceDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="sd")
 
 
 class StateMachineDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="stm")
 
 
 class UseCaseDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="uc")
 
 
@@ -10,7 +10,7 @@ from gaphor.core.modeling.properties import association, relation_many
 from gaphor.diagram.presentation import ElementPresentation
 from gaphor.diagram.shapes import DEFAULT_PADDING, Box, CssNode, Orientation, stroke
 from gaphor.diagram.support import represents
-from gaphor.diagram.text import Layout
+from gaphor.diagram.text import LAYOUT_POOL
 
 HEADER_HEIGHT: int = 29
 
@@ -112,25 +112,26 @@ class PartitionItem(ElementPresentation[UML.ActivityPartition]):
         padding_top, padding_right, padding_bottom, padding_left = context.style.get(
             "padding", DEFAULT_PADDING
         )
-        layout = Layout(
-            font=context.style,
-            width=partition_width - padding_left - padding_right,
-        )
         header_height = 0.0
-        for num, partition in enumerate(partitions):
-            cr.move_to(partition_width * num, 0)
-            cr.line_to(partition_width * num, bounding_box.height)
+        with LAYOUT_POOL.borrow() as layout:
             layout.set(
-                text=(
-                    f"{partition.name}: {partition.represents.name}"
-                    if isinstance(partition.represents, UML.NamedElement)
-                    else partition.name
-                )
+                font=context.style,
+                width=partition_width - padding_left - padding_right,
             )
-            cr.move_to(partition_width * num + padding_left, padding_top)
-            layout.show_layout(cr)
-            _, h = layout.size()
-            header_height = max(h, header_height)
+            for num, partition in enumerate(partitions):
+                cr.move_to(partition_width * num, 0)
+                cr.line_to(partition_width * num, bounding_box.height)
+                layout.set(
+                    text=(
+                        f"{partition.name}: {partition.represents.name}"
+                        if isinstance(partition.represents, UML.NamedElement)
+                        else partition.name
+                    )
+                )
+                cr.move_to(partition_width * num + padding_left, padding_top)
+                layout.show_layout(cr)
+                _, h = layout.size()
+                header_height = max(h, header_height)
 
         cr.move_to(bounding_box.width, 0)
         cr.line_to(bounding_box.width, bounding_box.height)
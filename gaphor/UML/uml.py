@@ -21,6 +21,7 @@ from typing import Callable
 
 from gaphor.core.modeling.base import Base
 class Element(Base):
+    __slots__ = ()
     appliedStereotype: relation_many[InstanceSpecification]
     comment: relation_many[Comment]
     note: _attribute[str] = _attribute("note", str)
@@ -31,6 +32,7 @@ class Element(Base):
 
 
 class NamedElement(Element):
+    __slots__ = ()
     clientDependency: relation_many[Dependency]
     memberNamespace: relation_one[Namespace]
     name: _attribute[str] = _attribute("name", str)
@@ -42,19 +44,23 @@ class NamedElement(Element):
 
 
 class PackageableElement(NamedElement):
+    __slots__ = ()
     component: relation_one[Component]
     owningPackage: relation_one[Package]
 
 
 class DeployedArtifact(NamedElement):
+    __slots__ = ()
     deployment: relation_many[Deployment]
 
 
 class DeploymentTarget(NamedElement):
+    __slots__ = ()
     deployment: relation_many[Deployment]
 
 
 class InstanceSpecification(DeployedArtifact, DeploymentTarget, PackageableElement):
+    __slots__ = ()
     classifier: relation_many[Classifier]
     extended: relation_many[Element]
     slot: relation_many[Slot]
@@ -62,25 +68,30 @@ class InstanceSpecification(DeployedArtifact, DeploymentTarget, PackageableEleme
 
 
 class EnumerationLiteral(InstanceSpecification):
+    __slots__ = ()
     enumeration: relation_one[Enumeration]
 
 
 class Relationship(Element):
+    __slots__ = ()
     abstraction: relation_many[InformationFlow]
     relatedElement: relation_many[Element]
 
 
 class DirectedRelationship(Relationship):
+    __slots__ = ()
     source: relation_many[Element]
     target: relation_many[Element]
 
 
 class PackageMerge(DirectedRelationship):
+    __slots__ = ()
     mergedPackage: relation_one[Package]
     mergingPackage: relation_one[Package]
 
 
 class RedefinableElement(NamedElement):
+    __slots__ = ()
     isLeaf: _attribute[int] = _attribute("isLeaf", int, default=True)
     redefinedElement: relation_many[RedefinableElement]
     redefinitionContext: relation_many[Classifier]
@@ -88,6 +99,7 @@ class RedefinableElement(NamedElement):
 
 
 class Namespace(NamedElement):
+    __slots__ = ()
     elementImport: relation_many[ElementImport]
     importedMember: derivedunion[PackageableElement]
     member: relation_many[NamedElement]
@@ -97,10 +109,12 @@ class Namespace(NamedElement):
 
 
 class Type(PackageableElement):
+    __slots__ = ()
     package: relation_one[Package]
 
 
 class Classifier(Namespace, RedefinableElement, Type):
+    __slots__ = ()
     attribute: relation_many[Property]
     componentRealization: relation_many[ComponentRealization]
     feature: relation_many[Feature]
@@ -118,6 +132,7 @@ class Classifier(Namespace, RedefinableElement, Type):
 
 
 class Association(Classifier, Relationship):
+    __slots__ = ()
     endType: derived[Type]
     isDerived: _attribute[int] = _attribute("isDerived", int, default=False)
     memberEnd: relation_many[Property]
@@ -126,21 +141,24 @@ class Association(Classifier, Relationship):
 
 
 class Extension(Association):
+    __slots__ = ()
     isRequired: _attribute[int] = _attribute("isRequired", int)
     metaclass: property
     ownedEnd: relation_one[ExtensionEnd]  # type: ignore[assignment]
 
 
 class BehavioredClassifier(Classifier):
+    __slots__ = ()
     interfaceRealization: relation_many[InterfaceRealization]
     ownedBehavior: relation_many[Behavior]
 
 
 class Actor(BehavioredClassifier):
-    pass
+    __slots__ = ()
 
 
 class ActivityNode(RedefinableElement):
+    __slots__ = ()
     activity: relation_one[Activity]
     inGroup: relation_many[ActivityGroup]
     inPartition: relation_many[ActivityPartition]
@@ -150,19 +168,21 @@ class ActivityNode(RedefinableElement):
 
 
 class ControlNode(ActivityNode):
-    pass
+    __slots__ = ()
 
 
 class MergeNode(ControlNode):
-    pass
+    __slots__ = ()
 
 
 class Feature(RedefinableElement):
+    __slots__ = ()
     featuringClassifier: relation_many[Classifier]
     isStatic: _attribute[int] = _attribute("isStatic", int, default=False)
 
 
 class ActivityEdge(RedefinableElement):
+    __slots__ = ()
     activity: relation_one[Activity]
     guard: _attribute[str] = _attribute("guard", str)
     inGroup: relation_many[ActivityGroup]
@@ -172,40 +192,44 @@ class ActivityEdge(RedefinableElement):
 
 
 class ObjectFlow(ActivityEdge):
-    pass
+    __slots__ = ()
 
 
 class FinalNode(ControlNode):
-    pass
+    __slots__ = ()
 
 
 class ActivityFinalNode(FinalNode):
-    pass
+    __slots__ = ()
 
 
 class CommunicationPath(Association):
-    pass
+    __slots__ = ()
 
 
 class Dependency(DirectedRelationship, PackageableElement):
+    __slots__ = ()
     client: relation_many[NamedElement]
     supplier: relation_many[NamedElement]
 
 
 class Abstraction(Dependency):
+    __slots__ = ()
     mapping: _attribute[str] = _attribute("mapping", str)
 
 
 class Realization(Abstraction):
-    pass
+    __slots__ = ()
 
 
 class TypedElement(NamedElement):
+    __slots__ = ()
     type: relation_one[Type]
     typeValue: _attribute[str] = _attribute("typeValue", str)
 
 
 class ObjectNode(ActivityNode, TypedElement):
+    __slots__ = ()
     isControlType: _attribute[int] = _attribute("isControlType", int, default=False)
     ordering = _enumeration("ordering", ("unordered", "ordered", "LIFO", "FIFO"), "unordered")
     selection: relation_one[Behavior]
@@ -213,6 +237,7 @@ class ObjectNode(ActivityNode, TypedElement):
 
 
 class MultiplicityElement(Element):
+    __slots__ = ()
     isOrdered: _attribute[int] = _attribute("isOrdered", int, default=True)
     isUnique: _attribute[int] = _attribute("isUnique", int, default=True)
     lower: _attribute[str]
@@ -222,16 +247,19 @@ class MultiplicityElement(Element):
 
 
 class Pin(MultiplicityElement, ObjectNode):
+    __slots__ = ()
     isControl: _attribute[int] = _attribute("isControl", int, default=False)
 
 
 class Generalization(DirectedRelationship):
+    __slots__ = ()
     general: relation_one[Classifier]
     isSubstitutable: _attribute[int] = _attribute("isSubstitutable", int)
     specific: relation_one[Classifier]
 
 
 class StructuredClassifier(Classifier):
+    __slots__ = ()
     ownedAttribute: relation_many[Property]
     ownedConnector: relation_many[Connector]
     part: property
@@ -239,10 +267,12 @@ class StructuredClassifier(Classifier):
 
 
 class EncapsulatedClassifier(StructuredClassifier):
+    __slots__ = ()
     ownedPort: relation_many[Port]
 
 
 class Class(BehavioredClassifier, EncapsulatedClassifier):
+    __slots__ = ()
     extension: property
     isActive: _attribute[int] = _attribute("isActive", int, default=False)
     nestedClassifier: relation_many[Classifier]
@@ -252,20 +282,23 @@ class Class(BehavioredClassifier, EncapsulatedClassifier):
 
 
 class Node(Class, DeploymentTarget):
+    __slots__ = ()
     nestedNode: relation_many[Node]
     node: relation_one[Node]
 
 
 class Device(Node):
-    pass
+    __slots__ = ()
 
 
 class StructuralFeature(Feature, MultiplicityElement, TypedElement):
+    __slots__ = ()
     isReadOnly: _attribute[int] = _attribute("isReadOnly", int, default=False)
     slot: relation_many[Slot]
 
 
 class UseCase(BehavioredClassifier):
+    __slots__ = ()
     extend: relation_many[Extend]
     extensionPoint: relation_many[ExtensionPoint]
     include: relation_many[Include]
@@ -273,14 +306,17 @@ class UseCase(BehavioredClassifier):
 
 
 class InputPin(Pin):
+    __slots__ = ()
     opaqueAction: relation_one[Action]
 
 
 class Manifestation(Abstraction):
+    __slots__ = ()
     artifact: relation_one[Artifact]
 
 
 class Component(Class):
+    __slots__ = ()
     isIndirectlyInstantiated: _attribute[int] = _attribute("isIndirectlyInstantiated", int, default=True)
     packagedElement: relation_many[PackageableElement]
     provided: property
@@ -289,11 +325,13 @@ class Component(Class):
 
 
 class ConnectableElement(TypedElement):
+    __slots__ = ()
     end: relation_many[ConnectorEnd]
     lifeline: relation_many[Lifeline]
 
 
 class Interface(Classifier, ConnectableElement):
+    __slots__ = ()
     nestedClassifier: relation_many[Classifier]
     ownedAttribute: relation_many[Property]
     ownedOperation: relation_many[Operation]
@@ -301,23 +339,27 @@ class Interface(Classifier, ConnectableElement):
 
 
 class Include(DirectedRelationship, NamedElement):
+    __slots__ = ()
     addition: relation_one[UseCase]
     includingCase: relation_one[UseCase]
 
 
 class ProfileApplication(DirectedRelationship):
+    __slots__ = ()
     appliedProfile: relation_one[Profile]
 
 
 class ExtensionPoint(RedefinableElement):
+    __slots__ = ()
     useCase: relation_one[UseCase]
 
 
 class Usage(Dependency):
-    pass
+    __slots__ = ()
 
 
 class ElementImport(DirectedRelationship):
+    __slots__ = ()
     alias: _attribute[str] = _attribute("alias", str)
     importedElement: relation_one[PackageableElement]
     importingNamespace: relation_one[Namespace]
@@ -325,6 +367,7 @@ class ElementImport(DirectedRelationship):
 
 
 class Property(ConnectableElement, StructuralFeature):
+    __slots__ = ()
     aggregation = _enumeration("aggregation", ("none", "shared", "composite"), "none")
     artifact: relation_one[Artifact]
     association: relation_one[Association]
@@ -345,38 +388,44 @@ class Property(ConnectableElement, StructuralFeature):
 
 
 class ExtensionEnd(Property):
+    __slots__ = ()
     type: relation_one[Stereotype]  # type: ignore[assignment]
 
 
 class DataType(Classifier):
+    __slots__ = ()
     ownedAttribute: relation_many[Property]
     ownedOperation: relation_many[Operation]
 
 
 class Enumeration(DataType):
+    __slots__ = ()
     ownedLiteral: relation_many[EnumerationLiteral]
 
 
 class Slot(Element):
+    __slots__ = ()
     definingFeature: relation_one[StructuralFeature]
     owningInstance: relation_one[InstanceSpecification]
     value: _attribute[str] = _attribute("value", str)
 
 
 class ExecutableNode(ActivityNode):
-    pass
+    __slots__ = ()
 
 
 class InitialNode(ControlNode):
-    pass
+    __slots__ = ()
 
 
 class Stereotype(Class):
+    __slots__ = ()
     icon: relation_many[Image]
     profile: relation_one[Profile]
 
 
 class Artifact(Classifier, DeployedArtifact):
+    __slots__ = ()
     artifact: relation_one[Artifact]
     manifestation: relation_many[Manifestation]
     nestedArtifact: relation_many[Artifact]
@@ -385,18 +434,21 @@ class Artifact(Classifier, DeployedArtifact):
 
 
 class ActivityParameterNode(ObjectNode):
+    __slots__ = ()
     parameter: relation_one[Parameter]
 
 
 class PrimitiveType(DataType):
-    pass
+    __slots__ = ()
 
 
 class DecisionNode(ControlNode):
+    __slots__ = ()
     decisionInput: relation_one[Behavior]
 
 
 class Package(Namespace, PackageableElement):
+    __slots__ = ()
     appliedProfile: relation_many[ProfileApplication]
     nestedPackage: relation_many[Package]
     ownedType: relation_many[Type]
@@ -406,11 +458,13 @@ class Package(Namespace, PackageableElement):
 
 
 class Profile(Package):
+    __slots__ = ()
     metaclassReference: relation_many[ElementImport]
     metamodelReference: relation_many[PackageImport]
 
 
 class Behavior(Class):
+    __slots__ = ()
     action_transition: relation_one[Transition]
     behavioredClassifier: relation_one[BehavioredClassifier]
     isReentrant: _attribute[int] = _attribute("isReentrant", int)
@@ -419,6 +473,7 @@ class Behavior(Class):
 
 
 class Activity(Behavior):
+    __slots__ = ()
     body: _attribute[str] = _attribute("body", str)
     edge: relation_many[ActivityEdge]
     group: relation_many[ActivityGroup]
@@ -427,11 +482,13 @@ class Activity(Behavior):
 
 
 class InterfaceRealization(Realization):
+    __slots__ = ()
     contract: relation_many[Interface]
     implementingClassifier: relation_one[BehavioredClassifier]
 
 
 class Parameter(ConnectableElement, MultiplicityElement):
+    __slots__ = ()
     defaultValue: _attribute[str] = _attribute("defaultValue", str)
     direction = _enumeration("direction", ("inout", "in", "out", "return"), "inout")
     operation: relation_one[Operation]
@@ -441,6 +498,7 @@ class Parameter(ConnectableElement, MultiplicityElement):
 
 
 class BehavioralFeature(Feature, Namespace):
+    __slots__ = ()
     isAbstract: _attribute[int] = _attribute("isAbstract", int)
     method: relation_many[Behavior]
     ownedParameter: relation_many[Parameter]
@@ -449,6 +507,7 @@ class BehavioralFeature(Feature, Namespace):
 
 
 class Operation(BehavioralFeature):
+    __slots__ = ()
     artifact: relation_one[Artifact]
     bodyCondition: relation_one[Constraint]
     class_: relation_one[Class]
@@ -464,18 +523,21 @@ class Operation(BehavioralFeature):
 
 
 class ControlFlow(ActivityEdge):
-    pass
+    __slots__ = ()
 
 
 class OutputPin(Pin):
+    __slots__ = ()
     opaqueAction: relation_one[Action]
 
 
 class ValuePin(InputPin):
+    __slots__ = ()
     value_: _attribute[str] = _attribute("value_", str)
 
 
 class Action(ExecutableNode):
+    __slots__ = ()
     body: _attribute[str] = _attribute("body", str)
     context_: relation_one[Classifier]
     effect: _attribute[str] = _attribute("effect", str)
@@ -485,10 +547,11 @@ class Action(ExecutableNode):
 
 
 class ExecutionEnvironment(Node):
-    pass
+    __slots__ = ()
 
 
 class Extend(DirectedRelationship, NamedElement):
+    __slots__ = ()
     constraint: relation_one[Constraint]
     extendedCase: relation_one[UseCase]
     extension: relation_one[UseCase]
@@ -496,6 +559,7 @@ class Extend(DirectedRelationship, NamedElement):
 
 
 class ActivityGroup(NamedElement):
+    __slots__ = ()
     activity: relation_one[Activity]
     edgeContents: relation_many[ActivityEdge]
     nodeContents: relation_many[ActivityNode]
@@ -504,6 +568,7 @@ class ActivityGroup(NamedElement):
 
 
 class Constraint(PackageableElement):
+    __slots__ = ()
     constrainedElement: relation_many[Element]
     owningState: relation_one[State]
     parameterSet: relation_one[ParameterSet]
@@ -513,18 +578,21 @@ class Constraint(PackageableElement):
 
 
 class PackageImport(DirectedRelationship):
+    __slots__ = ()
     importedPackage: relation_one[Package]
     importingNamespace: relation_one[Namespace]
     visibility = _enumeration("visibility", ("public", "private", "package", "protected"), "public")
 
 
 class InteractionFragment(NamedElement):
+    __slots__ = ()
     covered: relation_one[Lifeline]
     enclosingInteraction: relation_one[Interaction]
     generalOrdering: relation_many[GeneralOrdering]
 
 
 class Interaction(Behavior, InteractionFragment):
+    __slots__ = ()
     action: relation_many[Action]
     fragment: relation_many[InteractionFragment]
     lifeline: relation_many[Lifeline]
@@ -532,11 +600,13 @@ class Interaction(Behavior, InteractionFragment):
 
 
 class StateInvariant(InteractionFragment):
+    __slots__ = ()
     covered: relation_one[Lifeline]  # type: ignore[assignment]
     invariant: relation_one[Constraint]
 
 
 class Lifeline(NamedElement):
+    __slots__ = ()
     coveredBy: relation_many[InteractionFragment]
     interaction: relation_one[Interaction]
     represents: relation_one[ConnectableElement]
@@ -546,6 +616,7 @@ class Lifeline(NamedElement):
 
 
 class Message(NamedElement):
+    __slots__ = ()
     argument: _attribute[str] = _attribute("argument", str)
     interaction: relation_one[Interaction]
     messageEnd: relation_many[MessageEnd]
@@ -557,20 +628,24 @@ class Message(NamedElement):
 
 
 class MessageEnd(NamedElement):
+    __slots__ = ()
     message: relation_one[Message]
     receiveMessage: relation_one[Message]
     sendMessage: relation_one[Message]
 
 
 class OccurrenceSpecification(InteractionFragment):
+    __slots__ = ()
     covered: relation_one[Lifeline]  # type: ignore[assignment]
 
 
 class GeneralOrdering(NamedElement):
+    __slots__ = ()
     interactionFragment: relation_one[InteractionFragment]
 
 
 class Connector(Feature):
+    __slots__ = ()
     contract: relation_many[Behavior]
     end: relation_many[ConnectorEnd]
     informationFlow: relation_many[InformationFlow]
@@ -581,35 +656,40 @@ class Connector(Feature):
 
 
 class ConnectorEnd(MultiplicityElement):
+    __slots__ = ()
     definingEnd: relation_one[Property]
     partWithPort: relation_one[Property]
     role: relation_one[ConnectableElement]
 
 
 class FlowFinalNode(FinalNode):
-    pass
+    __slots__ = ()
 
 
 class JoinNode(ControlNode):
+    __slots__ = ()
     isCombineDuplicate: _attribute[int] = _attribute("isCombineDuplicate", int, default=True)
     joinSpec: _attribute[str] = _attribute("joinSpec", str)
 
 
 class ForkNode(ControlNode):
-    pass
+    __slots__ = ()
 
 
 class StateMachine(Behavior):
+    __slots__ = ()
     region: relation_many[Region]
 
 
 class Region(Namespace):
+    __slots__ = ()
     state: relation_one[State]
     stateMachine: relation_one[StateMachine]
     subvertex: relation_many[Vertex]
 
 
 class Transition(Namespace):
+    __slots__ = ()
     action: relation_one[Behavior]
     container: relation_one[Region]
     effect: relation_one[Behavior]
@@ -621,24 +701,28 @@ class Transition(Namespace):
 
 
 class Vertex(NamedElement):
+    __slots__ = ()
     container: relation_one[Region]
     incoming: relation_many[Transition]
     outgoing: relation_many[Transition]
 
 
 class Pseudostate(Vertex):
+    __slots__ = ()
     kind = _enumeration("kind", ("initial", "deepHistory", "shallowHistory", "join", "fork", "junction", "choice", "entryPoint", "exitPoint", "terminate"), "initial")
     state: relation_one[State]
     stateMachine: relation_one[StateMachine]
 
 
 class ConnectionPointReference(Vertex):
+    __slots__ = ()
     entry: relation_many[Pseudostate]
     exit: relation_many[Pseudostate]
     state: relation_one[State]
 
 
 class State(Namespace, Vertex):
+    __slots__ = ()
     doActivity: relation_one[Behavior]
     entry: relation_one[Behavior]
     exit: relation_one[Behavior]
@@ -648,21 +732,24 @@ class State(Namespace, Vertex):
 
 
 class FinalState(State):
-    pass
+    __slots__ = ()
 
 
 class Port(Property):
+    __slots__ = ()
     encapsulatedClassifier: relation_one[EncapsulatedClassifier]
     isBehavior: _attribute[int] = _attribute("isBehavior", int)
     isService: _attribute[int] = _attribute("isService", int)
 
 
 class Deployment(Dependency):
+    __slots__ = ()
     deployedArtifact: relation_many[DeployedArtifact]
     location: relation_one[DeploymentTarget]
 
 
 class ActivityPartition(ActivityGroup):
+    __slots__ = ()
     isDimension: _attribute[int] = _attribute("isDimension", int, default=False)
     isExternal: _attribute[int] = _attribute("isExternal", int, default=False)
     node: relation_many[ActivityNode]
@@ -671,106 +758,125 @@ class ActivityPartition(ActivityGroup):
 
 
 class MessageOccurrenceSpecification(MessageEnd, OccurrenceSpecification):
-    pass
+    __slots__ = ()
 
 
 class AcceptEventAction(Action):
+    __slots__ = ()
     isUnmarshall: _attribute[int] = _attribute("isUnmarshall", int, default=False)
     result: relation_many[OutputPin]
 
 
 class ReplyAction(Action):
+    __slots__ = ()
     replyValue: relation_one[InputPin]
     returnInformation: relation_one[InputPin]
 
 
 class UnmarshallAction(Action):
+    __slots__ = ()
     object: relation_one[InputPin]
     result: relation_many[OutputPin]
     unmarshallType: relation_one[Classifier]
 
 
 class AcceptCallAction(AcceptEventAction):
+    __slots__ = ()
     returnInformation: relation_one[OutputPin]
 
 
 class InvocationAction(Action):
+    __slots__ = ()
     argument: relation_many[InputPin]
 
 
 class SendSignalAction(InvocationAction):
+    __slots__ = ()
     target: relation_many[InputPin]
 
 
 class Collaboration(BehavioredClassifier, StructuredClassifier):
+    __slots__ = ()
     collaborationRole: relation_many[ConnectableElement]
 
 
 class Trigger(NamedElement):
+    __slots__ = ()
     event: relation_one[Event]
     port: relation_many[Port]
 
 
 class Event(PackageableElement):
-    pass
+    __slots__ = ()
 
 
 class ExecutionSpecification(InteractionFragment):
+    __slots__ = ()
     executionOccurrenceSpecification: relation_many[ExecutionOccurrenceSpecification]
     finish: relation_one[ExecutionOccurrenceSpecification]
     start: relation_one[ExecutionOccurrenceSpecification]
 
 
 class ExecutionOccurrenceSpecification(OccurrenceSpecification):
+    __slots__ = ()
     execution: relation_one[ExecutionSpecification]
 
 
 class ActionExecutionSpecification(ExecutionSpecification):
+    __slots__ = ()
     action: relation_one[Action]
 
 
 class BehaviorExecutionSpecification(ExecutionSpecification):
+    __slots__ = ()
     behavior: relation_one[Behavior]
 
 
 class ChangeEvent(Event):
+    __slots__ = ()
     changeExpression: _attribute[str] = _attribute("changeExpression", str)
 
 
 class StructuralFeatureAction(Action):
-    pass
+    __slots__ = ()
 
 
 class WriteStructuralFeatureAction(StructuralFeatureAction):
-    pass
+    __slots__ = ()
 
 
 class AddStructuralFeatureValueAction(WriteStructuralFeatureAction):
+    __slots__ = ()
     isReplaceAll: _attribute[int] = _attribute("isReplaceAll", int, default=False)
 
 
 class ParameterSet(NamedElement):
+    __slots__ = ()
     behavioralFeature: relation_one[BehavioralFeature]
     condition: relation_many[Constraint]
     parameter: relation_many[Parameter]
 
 
 class Image(Element):
+    __slots__ = ()
     content: _attribute[str] = _attribute("content", str)
     format: _attribute[str] = _attribute("format", str)
     name: _attribute[str] = _attribute("name", str)
 
 
 class ComponentRealization(Realization):
+    __slots__ = ()
     abstraction: relation_one[Component]  # type: ignore[assignment]
     realizingClassifier: relation_one[Classifier]
 
 
 class InformationItem(Classifier):
+    __slots__ = ()
     represented: relation_many[Classifier]
 
 
 class InformationFlow(DirectedRelationship, PackageableElement):
+    __slots__ = ()
     conveyed: relation_many[Classifier]
     informationSource: relation_one[NamedElement]
     informationTarget: relation_one[NamedElement]
@@ -781,82 +887,98 @@ class InformationFlow(DirectedRelationship, PackageableElement):
 
 
 class OpaqueAction(Action):
+    __slots__ = ()
     body: _attribute[str] = _attribute("body", str)
 
 
 class CallAction(InvocationAction):
+    __slots__ = ()
     isSynchronous: _attribute[int] = _attribute("isSynchronous", int, default=True)
     result: relation_many[OutputPin]
 
 
 class CallBehaviorAction(CallAction):
+    __slots__ = ()
     behavior: relation_one[Behavior]
 
 
 class ValueSpecificationAction(Action):
+    __slots__ = ()
     result: relation_one[OutputPin]
     value: _attribute[str] = _attribute("value", str)
 
 
 class Comment(Element):
+    __slots__ = ()
     annotatedElement: relation_many[Element]
     body: _attribute[str] = _attribute("body", str)
 
 
 from gaphor.core.modeling.diagram import Diagram as _Diagram
 class Diagram(NamedElement, _Diagram):
+    __slots__ = ()
     element: relation_one[Element]
 
 
 class StructureDiagram(Diagram):
-    pass
+    __slots__ = ()
 
 
 class BehaviorDiagram(Diagram):
-    pass
+    __slots__ = ()
 
 
 class ClassDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="cls")
 
 
 class PackageDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="pkg")
 
 
 class ComponentDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="cmp")
 
 
 class DeploymentDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="dep")
 
 
 class ProfileDiagram(StructureDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="prf")
 
 
 class ActivityDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="act")
 
 
 class InteractionDiagram(BehaviorDiagram):
-    pass
+    __slots__ = ()
 
 
 class SequenceDiagram(InteractionDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="sd")
 
 
 class CommunicationDiagram(InteractionDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="com")
 
 
 class StateMachineDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="stm")
 
 
 class UseCaseDiagram(BehaviorDiagram):
+    __slots__ = ()
     diagramType: _attribute[str] = _attribute("diagramType", str, default="uc")
 
 
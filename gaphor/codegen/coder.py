@@ -175,10 +175,13 @@ def coder(
                 continue
 
         yield class_declaration(c)
+        # Per-instance state lives in Base's __dict__, under the _name
+        # keys managed by the property descriptors; the generated
+        # subclasses add no attributes of their own, so declaring empty
+        # __slots__ only documents that.
+        yield "    __slots__ = ()"
         if properties := list(variables(c, overrides)):
             yield from (f"    {p}" for p in properties)
-        else:
-            yield "    pass"
         yield ""
         yield ""
 
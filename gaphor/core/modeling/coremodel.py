@@ -29,23 +29,27 @@ from gaphor.core.modeling.presentation import Presentation
 from gaphor.core.modeling.stylesheet import StyleSheet
 
 class PendingChange(Base):
+    __slots__ = ()
     applied: _attribute[int] = _attribute("applied", int, default=0)
     element_id: _attribute[str] = _attribute("element_id", str)
     op = _enumeration("op", ("add", "remove", "update"), "add")
 
 
 class ElementChange(PendingChange):
+    __slots__ = ()
     diagram_id: _attribute[str] = _attribute("diagram_id", str)
     element_name: _attribute[str] = _attribute("element_name", str)
     modeling_language: _attribute[str] = _attribute("modeling_language", str)
 
 
 class ValueChange(PendingChange):
+    __slots__ = ()
     property_name: _attribute[str] = _attribute("property_name", str)
     property_value: _attribute[str] = _attribute("property_value", str)
 
 
 class RefChange(PendingChange):
+    __slots__ = ()
     property_name: _attribute[str] = _attribute("property_name", str)
     property_ref: _attribute[str] = _attribute("property_ref", str)
 
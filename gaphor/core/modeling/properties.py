@@ -26,6 +26,7 @@ methods:
 from __future__ import annotations
 
 import logging
+import sys
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from typing import (
@@ -238,6 +239,12 @@ class attribute(umlproperty, Generic[T]):
         if self.type is int and isinstance(value, str | bool):
             value = 0 if value == "False" else 1 if value == "True" else int(value)
 
+        if self.type is str and type(value) is str and len(value) < 64:
+            # Short strings (names, operation kinds, ids) are drawn from a
+            # small set of values; intern them so loading thousands of
+            # elements shares one copy and comparisons are identity checks.
+            value = sys.intern(value)
+
         if value == self.get(obj):
             return
 
@@ -819,6 +826,17 @@ class derivedunion(derived[T]):
 
     def _union(self, obj, exclude=None):
         """Returns a union of all values as a set."""
+        if exclude is None and len(self.subsets) == 1:
+            # Degenerate union: no set merging needed, pass the subset
+            # values on directly.
+            (s,) = self.subsets
+            if not object_has_property(obj, s):
+                return []
+            value = s.get(obj)
+            if isinstance(value, Iterable):
+                return list(value)
+            return [value] if value else []
+
         u: set[T] = set()
         for s in self.subsets:
             if s is exclude or not object_has_property(obj, s):
@@ -731,6 +731,42 @@ def test_derivedunion():
     assert d in a.u
 
 
+def test_derivedunion_with_single_many_subset():
+    class A(Base):
+        a: relation_many[A]
+        u: relation_many[A]
+
+    A.a = association("a", A)
+    A.u = derivedunion("u", object, 0, "*", A.a)
+
+    a = A()
+    assert len(a.u) == 0, f"a.u = {a.u}"
+
+    a.a = b = A()
+    a.a = c = A()
+    assert len(a.u) == 2, f"a.u = {a.u}"
+    assert b in a.u
+    assert c in a.u
+
+
+def test_derivedunion_with_single_one_subset():
+    class A(Base):
+        a: relation_one[A]
+        u: relation_one[A]
+
+    A.a = association("a", A, 0, 1)
+    A.u = derivedunion("u", object, 0, 1, A.a)
+
+    a = A()
+    assert a.u is None
+
+    a.a = b = A()
+    assert a.u is b
+
+    del a.a
+    assert a.u is None
+
+
 def test_derivedunion_notify_for_single_derived_property():
     class A(Base):
         pass
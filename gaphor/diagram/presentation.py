@@ -16,7 +16,7 @@ from gaphor.core.modeling.event import AttributeUpdated, RevertibleEvent
 from gaphor.core.modeling.presentation import Presentation, S, literal_eval
 from gaphor.core.modeling.properties import attribute
 from gaphor.diagram.shapes import CssNode, Shape, Text, stroke, traverse_css_nodes
-from gaphor.diagram.text import TextAlign, middle_segment, text_point_at_line
+from gaphor.diagram.text import TextAlign, middle_segment, text_points_at_line
 
 DEFAULT_HEIGHT = 50
 DEFAULT_WIDTH = 100
@@ -225,6 +225,9 @@ class LinePresentation(gaphas.Line, HandlePositionUpdate, Presentation[S]):
         self._shape_head_rect = None
         self._shape_middle_rect = None
         self._shape_tail_rect = None
+        self._text_positions: list = []
+        self._geometry_version = 0
+        self._middle_segment_cache: tuple | None = None
 
         self.watch_handle(self.head)
         self.watch_handle(self.tail)
@@ -257,26 +260,50 @@ class LinePresentation(gaphas.Line, HandlePositionUpdate, Presentation[S]):
         return self._shape_middle_rect
 
     def insert_handle(self, index: int, handle: Handle) -> None:
+        self._geometry_version += 1
         super().insert_handle(index, handle)
         self.watch_handle(handle)
         self.update_orthogonal_constraints()
 
     def remove_handle(self, handle: Handle) -> None:
+        self._geometry_version += 1
         self.remove_watch_handle(handle)
         super().remove_handle(handle)
         self.update_orthogonal_constraints()
 
-    def update_shape_bounds(self, context):
-        def shape_bounds(shape, align):
-            if shape:
-                size = shape.size(context)
-                x, y = text_point_at_line(points, size, align)
-                return Rectangle(x, y, *size)
+    def _on_handle_position_update(self, position, old):
+        self._geometry_version += 1
+        super()._on_handle_position_update(position, old)
+
+    def _middle_segment(self):
+        """The middle segment of the line, recomputed only when the line
+        geometry changed since the last call."""
+        cached = self._middle_segment_cache
+        if cached is None or cached[0] != self._geometry_version:
+            cached = (
+                self._geometry_version,
+                middle_segment([h.pos for h in self._handles]),
+            )
+            self._middle_segment_cache = cached
+        return cached[1]
 
+    def update_shape_bounds(self, context):
         points = [h.pos for h in self.handles()]
-        self._shape_head_rect = shape_bounds(self._shape_head, TextAlign.LEFT)
-        self._shape_middle_rect = shape_bounds(self._shape_middle, TextAlign.CENTER)
-        self._shape_tail_rect = shape_bounds(self._shape_tail, TextAlign.RIGHT)
+        sizes = [
+            shape.size(context) if shape else None
+            for shape in (self._shape_head, self._shape_middle, self._shape_tail)
+        ]
+        positions = text_points_at_line(
+            points,
+            sizes,
+            (TextAlign.LEFT, TextAlign.CENTER, TextAlign.RIGHT),
+            out=self._text_positions,
+            middle=self._middle_segment() if self._shape_middle else None,
+        )
+        self._shape_head_rect, self._shape_middle_rect, self._shape_tail_rect = (
+            Rectangle(*pos, *size) if size else None
+            for pos, size in zip(positions, sizes, strict=True)
+        )
 
     def css_nodes(self) -> Iterator[CssNode]:
         if self._shape_head:
@@ -1,12 +1,15 @@
 import pytest
 
 from gaphor.diagram.text import (
+    LAYOUT_POOL,
     FontStyle,
     FontWeight,
     Layout,
     TextAlign,
     TextDecoration,
+    middle_segment,
     text_point_at_line,
+    text_points_at_line,
 )
 
 
@@ -67,6 +70,63 @@ def test_point_at_center_bottom(points, point_at_line):
     assert y == pytest.approx(point_at_line[1])
 
 
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(0, 0), (20, 20)],
+        [(0, 0), (-20, 20)],
+        [(0, 0), (20, -20)],
+        [(0, 0), (-20, -20)],
+        [(2.0, 2.0), (7.0, 22.0)],
+        [(2.0, 2.0), (-3.0, -18.0)],
+        [(2.0, 2.0), (2.0, 22.0)],
+        [(0, 0), (10, 0), (20, 20), (30, 20)],
+    ],
+)
+def test_points_at_line_match_scalar_placement(points):
+    text_aligns = (TextAlign.LEFT, TextAlign.CENTER, TextAlign.RIGHT)
+
+    positions = text_points_at_line(points, [(10, 5)] * 3, text_aligns)
+
+    assert positions == [
+        text_point_at_line(points, (10, 5), text_align) for text_align in text_aligns
+    ]
+
+
+def test_points_at_line_with_none_size():
+    points = [(0, 0), (20, 20)]
+
+    positions = text_points_at_line(
+        points,
+        [(10, 5), None, (10, 5)],
+        (TextAlign.LEFT, TextAlign.CENTER, TextAlign.RIGHT),
+    )
+
+    assert positions[0] == text_point_at_line(points, (10, 5), TextAlign.LEFT)
+    assert positions[1] is None
+    assert positions[2] == text_point_at_line(points, (10, 5), TextAlign.RIGHT)
+
+
+def test_points_at_line_reuses_out_list():
+    points = [(0, 0), (20, 20)]
+    out = [("stale", "entry")]
+
+    positions = text_points_at_line(points, [(10, 5)], (TextAlign.CENTER,), out=out)
+
+    assert positions is out
+    assert positions == [text_point_at_line(points, (10, 5), TextAlign.CENTER)]
+
+
+def test_points_at_line_with_precomputed_middle_segment():
+    points = [(0, 0), (10, 0), (20, 20), (30, 20)]
+
+    positions = text_points_at_line(
+        points, [(10, 5)], (TextAlign.CENTER,), middle=middle_segment(points)
+    )
+
+    assert positions == [text_point_at_line(points, (10, 5), TextAlign.CENTER)]
+
+
 def test_text_with_font_as_dict():
     w, h = Layout(
         "Example",
@@ -101,3 +161,60 @@ def test_text_with_just_font_as_dict():
     w, h = Layout("Example", {"font-family": "sans", "font-size": 10}).size()
     assert w
     assert h
+
+
+def test_pooled_layout_is_reset_on_release():
+    with LAYOUT_POOL.borrow() as layout:
+        layout.set(
+            text="Example",
+            font={"font-family": "sans", "font-size": 10},
+            width=100,
+        )
+        layout.size()
+
+    with LAYOUT_POOL.borrow() as layout:
+        assert not layout.text
+        assert layout.font_id is None
+        assert layout.width == -1
+        assert layout.size() == (0, 0)
+
+
+def test_size_reuses_cached_measurement(monkeypatch):
+    layout = Layout("Example", {"font-family": "sans", "font-size": 10})
+    size = layout.size()
+
+    # A repeat measurement should not touch Pango at all
+    monkeypatch.setattr(layout, "layout", None)
+
+    assert layout.size() == size
+
+
+def test_size_remeasures_on_text_change():
+    layout = Layout("Example", {"font-family": "sans", "font-size": 10})
+    w, _ = layout.size()
+
+    layout.set_text("Example, but much longer")
+
+    new_w, _ = layout.size()
+    assert new_w > w
+
+
+def test_size_remeasures_on_font_change():
+    layout = Layout("Example", {"font-family": "sans", "font-size": 10})
+    w, h = layout.size()
+
+    layout.set_font({"font-family": "sans", "font-size": 20})
+
+    new_w, new_h = layout.size()
+    assert new_w > w
+    assert new_h > h
+
+
+def test_size_remeasures_on_width_change():
+    layout = Layout("Example example example", {"font-family": "sans", "font-size": 10})
+    w, h = layout.size()
+
+    layout.set_width(w // 3)
+
+    _, new_h = layout.size()
+    assert new_h > h
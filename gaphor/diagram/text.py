@@ -2,12 +2,130 @@
 
 from __future__ import annotations
 
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+
 from gaphas.canvas import instant_cairo_context
 from gaphas.painter.freehand import FreeHandCairoContext
-from gi.repository import Pango, PangoCairo
+from gi.repository import Pango
 
 from gaphor.core.styling import FontStyle, FontWeight, Style, TextAlign, TextDecoration
 
+PangoCairo = None
+
+
+def _pangocairo():
+    """The PangoCairo module, imported on first use.
+
+    Importing this module should not pull in the PangoCairo typelib;
+    it is only needed once layouts are created or rendered.
+    """
+    global PangoCairo
+    if PangoCairo is None:
+        from gi.repository import PangoCairo as pangocairo
+
+        PangoCairo = pangocairo
+    return PangoCairo
+
+
+# Style enum -> Pango enum, so the hot paths do not need getattr() lookups
+_ALIGNMENT = {
+    TextAlign.LEFT: Pango.Alignment.LEFT,
+    TextAlign.CENTER: Pango.Alignment.CENTER,
+    TextAlign.RIGHT: Pango.Alignment.RIGHT,
+}
+_WEIGHT = {
+    FontWeight.NORMAL: Pango.Weight.NORMAL,
+    FontWeight.BOLD: Pango.Weight.BOLD,
+}
+_STYLE = {
+    FontStyle.NORMAL: Pango.Style.NORMAL,
+    FontStyle.ITALIC: Pango.Style.ITALIC,
+}
+
+
+@lru_cache(maxsize=128)
+def _font_description(
+    font_family: str,
+    font_size: float | str,
+    font_weight: FontWeight | None,
+    font_style: FontStyle | None,
+) -> Pango.FontDescription:
+    """A shared font description: there are only a few distinct fonts in a
+    diagram, so do not build a new description for every font change."""
+    fd = Pango.FontDescription.new()
+    fd.set_family(font_family)
+    fd.set_absolute_size(font_size * Pango.SCALE)
+
+    if font_weight:
+        fd.set_weight(_WEIGHT[font_weight])
+    if font_style:
+        fd.set_style(_STYLE[font_style])
+    return fd
+
+
+@lru_cache(maxsize=2)
+def _underline_attrs(underline: bool) -> Pango.AttrList:
+    """A shared attribute list to turn underlining on or off.
+
+    The lists are never mutated, so one instance per state can be
+    shared by all layouts.
+    """
+    attrs = Pango.AttrList.new()
+    attrs.insert(
+        Pango.attr_underline_new(
+            Pango.Underline.SINGLE if underline else Pango.Underline.NONE
+        )
+    )
+    return attrs
+
+
+_tls = threading.local()
+
+
+def _pango_context() -> Pango.Context:
+    """A shared, per-thread Pango context.
+
+    Creating a layout only requires a context, not a Cairo surface per
+    Layout instance.
+    """
+    try:
+        return _tls.context
+    except AttributeError:
+        context = _pangocairo().create_context(instant_cairo_context())
+        _tls.context = context
+        return context
+
+
+def _show_layout_freehand(cr, layout):
+    _pangocairo().show_layout(cr.cr, layout)
+
+
+def _show_layout_plain(cr, layout):
+    _pangocairo().show_layout(cr, layout)
+
+
+# Cairo context type -> show function, filled per type on first use, so
+# drawing dispatches on one dict lookup instead of isinstance checks.
+_SHOW_LAYOUT_DISPATCH: dict[type, Callable] = {
+    FreeHandCairoContext: _show_layout_freehand,
+}
+
+
+def _show_layout_fn(cr_type: type) -> Callable:
+    fn = _SHOW_LAYOUT_DISPATCH.get(cr_type)
+    if fn is None:
+        fn = (
+            _show_layout_freehand
+            if issubclass(cr_type, FreeHandCairoContext)
+            else _show_layout_plain
+        )
+        _SHOW_LAYOUT_DISPATCH[cr_type] = fn
+    return fn
+
 
 class Layout:
     def __init__(
@@ -18,13 +136,18 @@ class Layout:
         text_align: TextAlign = TextAlign.CENTER,
         default_size: tuple[int, int] = (0, 0),
     ):
-        self.layout = PangoCairo.create_layout(instant_cairo_context())
+        self.layout = Pango.Layout.new(_pango_context())
         self.font_id: (
             tuple[str, float | str, FontWeight | None, FontStyle | None] | None
         ) = None
         self.text = ""
         self.width = -1
+        self._last_pango_width = -1
         self.default_size = default_size
+        self.text_align: TextAlign | None = None
+        self._size_cache: dict[tuple, tuple[int, int]] = {}
+        self._last_key: tuple | None = None
+        self._last_size: tuple[int, int] = default_size
 
         if text:
             self.set_text(text)
@@ -59,30 +182,13 @@ class Layout:
 
         self.font_id = font_id
 
-        fd = Pango.FontDescription.new()
-        fd.set_family(font_family)
-        fd.set_absolute_size(font_size * Pango.SCALE)
-
-        if font_weight:
-            assert isinstance(font_weight, FontWeight)
-            fd.set_weight(getattr(Pango.Weight, font_weight.name))
-        if font_style:
-            assert isinstance(font_style, FontStyle)
-            fd.set_style(getattr(Pango.Style, font_style.name))
-
-        self.layout.set_font_description(fd)
+        self.layout.set_font_description(_font_description(*font_id))
 
         underline = (
             font.get("text-decoration", TextDecoration.NONE) == TextDecoration.UNDERLINE
         )
 
-        attrs = Pango.AttrList.new()
-        attrs.insert(
-            Pango.attr_underline_new(
-                Pango.Underline.SINGLE if underline else Pango.Underline.NONE
-            )
-        )
-        self.layout.set_attributes(attrs)
+        self.layout.set_attributes(_underline_attrs(underline))
 
     def set_text(self, text: str) -> None:
         if text != self.text:
@@ -91,31 +197,93 @@ class Layout:
 
     def set_width(self, width: int) -> None:
         self.width = width
+        if width == self._last_pango_width:
+            return
+        self._last_pango_width = width
         if width == -1:
             self.layout.set_width(-1)
         else:
-            self.layout.set_width(int(width * Pango.SCALE))
+            self.layout.set_width(min(int(width * Pango.SCALE), 2147483647))
 
     def set_alignment(self, text_align: TextAlign) -> None:
-        self.layout.set_alignment(getattr(Pango.Alignment, text_align.name))
+        if text_align == self.text_align:
+            return
+        self.text_align = text_align
+        self.layout.set_alignment(_ALIGNMENT[text_align])
+
+    def reset(self) -> None:
+        """Restore the state of a freshly constructed layout.
+
+        Clears the text, font, width and cached measurements, so the
+        instance can be handed to a new user without leaking state.
+        """
+        self.set_text("")
+        self.set_width(-1)
+        self.set_alignment(TextAlign.CENTER)
+        self.font_id = None
+        self.layout.set_font_description(None)
+        self.layout.set_attributes(_underline_attrs(False))
+        self.default_size = (0, 0)
+        self._size_cache.clear()
+        self._last_key = None
+        self._last_size = (0, 0)
 
     def size(self) -> tuple[int, int]:
         if not self.text:
             return self.default_size
-        self.set_width(self.width)
-        return self.layout.get_pixel_size()  # type: ignore[no-any-return]
+        key = (self.text, self.font_id, self.width)
+        if key == self._last_key:
+            return self._last_size
+        size = self._size_cache.get(key)
+        if size is None:
+            size = self.layout.get_pixel_size()
+            if len(self._size_cache) > 64:
+                self._size_cache.clear()
+            self._size_cache[key] = size
+        self._last_key = key
+        self._last_size = size
+        return size
 
     def show_layout(self, cr, width=None, default_size=None):
         layout = self.layout
         if not self.text:
             return default_size or self.default_size
         if width is not None:
-            layout.set_width(min(int(width * Pango.SCALE), 2147483647))
+            self.set_width(width)
 
-        if isinstance(cr, FreeHandCairoContext):
-            PangoCairo.show_layout(cr.cr, layout)
-        else:
-            PangoCairo.show_layout(cr, layout)
+        _show_layout_fn(type(cr))(cr, layout)
+
+
+class _LayoutPool:
+    """A bounded free list of reusable Layout instances.
+
+    Use this for short-lived layouts that are created during a draw
+    pass, so the Pango layout objects do not have to be reconstructed
+    every frame.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self._pool: deque[Layout] = deque()
+        self._maxsize = maxsize
+
+    def acquire(self) -> Layout:
+        return self._pool.pop() if self._pool else Layout()
+
+    def release(self, layout: Layout) -> None:
+        if len(self._pool) < self._maxsize:
+            layout.reset()
+            self._pool.append(layout)
+
+    @contextmanager
+    def borrow(self) -> Iterator[Layout]:
+        layout = self.acquire()
+        try:
+            yield layout
+        finally:
+            self.release(layout)
+
+
+LAYOUT_POOL = _LayoutPool()
 
 
 def text_point_at_line(points, size, text_align):
@@ -127,19 +295,59 @@ def text_point_at_line(points, size, text_align):
      - text_align: alignment to the line: left, beginning of the line, center, middle and right: end of the line
     """
 
+    width, height = size
     if text_align == TextAlign.LEFT:
-        p0 = points[0]
-        p1 = points[1]
-        x, y = _text_point_at_line_end(size, p0, p1)
+        p1, p2 = points[0], points[1]
+        return _text_point_at_line_end(width, height, p1[0], p1[1], p2[0], p2[1])
     elif text_align == TextAlign.CENTER:
-        p0, p1 = middle_segment(points)
-        x, y = _text_point_at_line_center(size, p0, p1)
+        p1, p2 = middle_segment(points)
+        return _text_point_at_line_center(width, height, p1[0], p1[1], p2[0], p2[1])
     elif text_align == TextAlign.RIGHT:
-        p0 = points[-1]
-        p1 = points[-2]
-        x, y = _text_point_at_line_end(size, p0, p1)
+        p1, p2 = points[-1], points[-2]
+        return _text_point_at_line_end(width, height, p1[0], p1[1], p2[0], p2[1])
+    raise ValueError(f"Unknown text align {text_align}")
 
-    return x, y
+
+def text_points_at_line(points, sizes, text_aligns, out=None, middle=None):
+    """Provide positions (x, y) to draw several texts close to one line.
+
+    A batched variant of `text_point_at_line`: the line ends and the
+    middle segment are resolved once and shared between all texts.
+
+    Parameters:
+     - points:  the line points, a list of (x, y) points
+     - sizes:   the text sizes, (width, height) tuples; a None entry yields a None position
+     - text_aligns: the alignments to the line, one per size
+     - out:     optional list to hold the result, so callers drawing every
+       frame can reuse one list instead of allocating per call
+     - middle:  optional precomputed middle segment, for callers that cache it
+    """
+    if out is None:
+        positions = []
+    else:
+        out.clear()
+        positions = out
+    for size, text_align in zip(sizes, text_aligns, strict=True):
+        if size is None:
+            positions.append(None)
+            continue
+        width, height = size
+        if text_align == TextAlign.CENTER:
+            if middle is None:
+                middle = middle_segment(points)
+            p1, p2 = middle
+            positions.append(
+                _text_point_at_line_center(width, height, p1[0], p1[1], p2[0], p2[1])
+            )
+        else:
+            if text_align == TextAlign.LEFT:
+                p1, p2 = points[0], points[1]
+            else:
+                p1, p2 = points[-1], points[-2]
+            positions.append(
+                _text_point_at_line_end(width, height, p1[0], p1[1], p2[0], p2[1])
+            )
+    return positions
 
 
 def middle_segment(points):
@@ -149,21 +357,19 @@ def middle_segment(points):
     return points[m - 1], points[m]
 
 
-def _text_point_at_line_end(size, p1, p2):
-    """Calculate position of the text relative to a line defined by points p1
-    and p2.
+def _text_point_at_line_end(name_w, name_h, p1x, p1y, p2x, p2y):
+    """Calculate position of the text relative to a line defined by points
+    (p1x, p1y) and (p2x, p2y).
 
     Parameters:
-     - size: text size, a (width, height) tuple
-     - p1:      beginning of line segment
-     - p2:      end of line segment
+     - name_w, name_h: text size
+     - p1x, p1y:       beginning of line segment
+     - p2x, p2y:       end of line segment
     """
     ofs = 5
 
-    dx = float(p2[0]) - float(p1[0])
-    dy = float(p2[1]) - float(p1[1])
-
-    name_w, name_h = size
+    dx = p2x - p1x
+    dy = p2y - p1y
 
     rc = 1000.0 if dy == 0 else dx / dy
     abs_rc = abs(rc)
@@ -187,28 +393,25 @@ def _text_point_at_line_end(size, p1, p2):
         align_bottom = v ^ r
         name_dx = ofs if align_left else -ofs - name_w
         name_dy = -ofs - name_h if align_bottom else ofs
-    return p1[0] + name_dx, p1[1] + name_dy
+    return p1x + name_dx, p1y + name_dy
 
 
-# hint tuples to move text depending on quadrant
-WIDTH_HINT = (-1, -1, 0)
-PADDING_HINT = (1, 1, -1)
 EPSILON = 1e-6
 
 
-def _text_point_at_line_center(size, p1, p2):
-    """Calculate position of the text relative to a line defined by points p1
-    and p2.
+def _text_point_at_line_center(width, height, p1x, p1y, p2x, p2y):
+    """Calculate position of the text relative to a line defined by points
+    (p1x, p1y) and (p2x, p2y).
 
     Parameters:
-     - size:    text size, a (width, height) tuple
-     - p1:      beginning of line
-     - p2:      end of line
+     - width, height: text size
+     - p1x, p1y:      beginning of line
+     - p2x, p2y:      end of line
     """
-    x0 = (p1[0] + p2[0]) / 2.0
-    y0 = (p1[1] + p2[1]) / 2.0
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
+    x0 = (p1x + p2x) / 2.0
+    y0 = (p1y + p2y) / 2.0
+    dx = p2x - p1x
+    dy = p2y - p1y
     ofs = 3
 
     if abs(dx) < EPSILON:
@@ -221,8 +424,6 @@ def _text_point_at_line_center(size, p1, p2):
         d1 = dy / dx
         d2 = abs(d1)
 
-    width, height = size
-
     # move to center and move by delta depending on line angle
     if d2 < 0.5774:  # <0, 30>, <150, 180>, <-180, -150>, <-30, 0>
         # horizontal mode
@@ -235,12 +436,10 @@ def _text_point_at_line_center(size, p1, p2):
         # much better in case of vertical lines
 
         # determine quadrant, we are interested in 1 or 3 and 2 or 4
-        # see hint tuples below
         h2 = height / 2.0
-        q = (d1 > 0) - (d1 < 0)
+        neg = d1 < 0
         hint = 0 if abs(dx) < EPSILON else h2 / d2
-        x = x0 - hint + width * WIDTH_HINT[q]
-        x = x0 - (ofs + hint) * PADDING_HINT[q] + width * WIDTH_HINT[q]
+        x = x0 - (ofs + hint) * (1 - 2 * neg) + width * (neg - 1)
         y = y0 - h2
 
     return x, y